@@ -1,7 +1,33 @@
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-from requests.exceptions import HTTPError
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+METADATA_TTL = 3600
+
+_VALID_TIME_VALIDITY = frozenset({"GTC", "DAY"})
+
+
+class _Throttle:
+    """Spaces out calls to stay under a requests-per-second limit"""
+
+    def __init__(self, rate_limit_per_sec: float):
+        self._interval = 1 / rate_limit_per_sec
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Reserve the next slot and return the seconds to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+        return max(delay, 0)
 
 
 class Trading212:
@@ -11,101 +37,175 @@ class Trading212:
         """ """
         self._api_key = api_key
         self.host = (
-            "https://live.trading212.com" if demo else "https://live.trading212.com"
+            "https://demo.trading212.com" if demo else "https://live.trading212.com"
         )
-
-    def _get(self, endpoint: str, params=None, api_version: str = "v0"):
-        return self._process_response(
-            requests.get(
-                f"{self.host}/api/{api_version}/{endpoint}",
-                headers={"Authorization": self._api_key},
-                params=params,
-            )
+        self._api_base = {"v0": f"{self.host}/api/v0/"}
+        # (connect, read) timeouts in seconds
+        self._timeout = (5, 30)
+        # requests is imported lazily to keep the package import cheap
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self._session = requests.Session()
+        # Accept-Encoding is left to requests, which only advertises
+        # compression schemes it can decode (br needs brotli installed)
+        self._session.headers.update(
+            {"Authorization": api_key, "Accept": "application/json"}
         )
-
-    def _post(self, endpoint: str, data: dict, api_version: str = "v0"):
-        return self._process_response(
-            requests.post(
-                f"{self.host}/api/{api_version}/{endpoint}",
-                headers={"Authorization": self._api_key},
-                data=data,
-            )
+        # Only idempotent requests are retried, order placement is never repeated
+        retry = Retry(
+            total=5,
+            backoff_factor=0.25,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
         )
-
-    def _get_url(
-        self,
-        url,
-    ):
-        return self._process_response(
-            requests.get(
-                f"{self.host}/{url}",
-                headers={"Authorization": self._api_key},
-            )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry),
         )
+        self._cache = {}
+        self._cache_locks = {}
+        self._cache_lock = threading.Lock()
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self._session.close()
 
-    def _delete_url(
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _send(
         self,
-        url,
+        method: str,
+        path: str,
+        *,
+        params=None,
+        json=None,
+        headers=None,
+        absolute: bool = False,
+        api_version: str = "v0",
     ):
-        return self._process_response(
-            requests.delete(
-                f"{self.host}/{url}",
-                headers={"Authorization": self._api_key},
-            )
+        if absolute:
+            url = f"{self.host}/{path.lstrip('/')}"
+        else:
+            base = self._api_base.get(api_version)
+            url = (base or f"{self.host}/api/{api_version}/") + path
+
+        return self._session.request(
+            method,
+            url,
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=self._timeout,
         )
 
+    def _request(self, method: str, path: str, **kwargs):
+        return self._process_response(self._send(method, path, **kwargs))
+
+    def _get(self, endpoint: str, params=None, api_version: str = "v0"):
+        return self._request("GET", endpoint, params=params, api_version=api_version)
+
+    def _post(self, endpoint: str, data: dict, api_version: str = "v0"):
+        return self._request("POST", endpoint, json=data, api_version=api_version)
+
+    def _get_cached(self, endpoint: str, ttl: float, params=None):
+        key = (endpoint, frozenset((params or {}).items()))
+        with self._cache_lock:
+            key_lock = self._cache_locks.setdefault(key, threading.Lock())
+        # The per-key lock is held while fetching, so concurrent identical
+        # calls wait for the first one while other endpoints proceed
+        with key_lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[2]
+            # Expired entries are revalidated, a 304 keeps the cached data
+            headers = {"If-None-Match": entry[1]} if entry and entry[1] else None
+            resp = self._send("GET", endpoint, params=params, headers=headers)
+            if resp.status_code == 304:
+                etag, data = entry[1], entry[2]
+            else:
+                etag, data = resp.headers.get("ETag"), self._process_response(resp)
+            self._cache[key] = (time.monotonic() + ttl, etag, data)
+            return data
+
+    def clear_cache(self):
+        """Drop cached metadata responses"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _get_url(self, url):
+        return self._request("GET", url, absolute=True)
+
+    def _delete_url(self, url):
+        return self._request("DELETE", url, absolute=True)
+
     @staticmethod
     def _process_response(resp):
+        from requests.exceptions import HTTPError
+
         try:
             resp.raise_for_status()
         except HTTPError as http_err:
             logging.error(resp.text)
             raise http_err
 
-        return resp.json()
+        if not resp.content:
+            return None
 
-    def _process_items(self, response):
-        res = []
-        res += response["items"]
+        return _loads(resp.content)
+
+    def _iter_items(self, response):
+        yield from response["items"]
         while next_page := response.get("nextPagePath"):
             response = self._get_url(next_page)
-            res += response["items"]
-
-        return res
+            yield from response["items"]
 
     @staticmethod
     def _validate_time_validity(time_validity: str):
-        if time_validity not in ["GTC", "DAY"]:
+        if time_validity not in _VALID_TIME_VALIDITY:
             raise ValueError("time_validity must be one of GTC or DAY")
 
-    def orders(self, cursor: int = 0, ticker: str = None, limit: int = 50):
-        """Historical order data"""
-
+    def _iter_history(self, endpoint: str, cursor: int, limit: int, ticker=None):
         params = {"cursor": cursor, "limit": limit}
         if ticker:
             params["ticker"] = ticker
 
-        return self._process_items(self._get("equity/history/orders", params=params))
+        yield from self._iter_items(self._get(endpoint, params=params))
+
+    def iter_orders(self, cursor: int = 0, ticker: str = None, limit: int = 50):
+        """Historical order data, fetched page by page"""
+        return self._iter_history("equity/history/orders", cursor, limit, ticker)
+
+    def orders(self, cursor: int = 0, ticker: str = None, limit: int = 50):
+        """Historical order data"""
+        return list(self.iter_orders(cursor=cursor, ticker=ticker, limit=limit))
+
+    def iter_dividends(self, cursor: int = 0, ticker: str = None, limit: int = 50):
+        """Dividends paid out, fetched page by page"""
+        return self._iter_history("history/dividends", cursor, limit, ticker)
 
     def dividends(self, cursor: int = 0, ticker: str = None, limit: int = 50):
         """Dividends paid out"""
+        return list(self.iter_dividends(cursor=cursor, ticker=ticker, limit=limit))
 
-        params = {"cursor": cursor, "limit": limit}
-        if ticker:
-            params["ticker"] = ticker
-
-        return self._process_items(self._get("history/dividends", params=params))
+    def iter_transactions(self, cursor: int = 0, limit: int = 50):
+        """Transactions list, fetched page by page"""
+        return self._iter_history("history/transactions", cursor, limit)
 
     def transactions(self, cursor: int = 0, limit: int = 50):
         """Transactions list"""
-
-        params = {"cursor": cursor, "limit": limit}
-
-        return self._process_items(self._get("history/transactions", params=params))
+        return list(self.iter_transactions(cursor=cursor, limit=limit))
 
     def instruments(self):
         """Tradeable instruments metadata"""
-        return self._get("equity/metadata/instruments")
+        return self._get_cached("equity/metadata/instruments", ttl=METADATA_TTL)
 
     def cash(self):
         """Account cash"""
@@ -119,13 +219,32 @@ class Trading212:
         """Open position by ticker"""
         return self._get(f"equity/portfolio/{ticker}")
 
+    def bulk_positions(
+        self, tickers, max_workers: int = 8, rate_limit_per_sec: float = None
+    ):
+        """Open positions for several tickers, fetched concurrently
+
+        Every ticker is a separate API call and counts against the Trading212
+        rate limit, use rate_limit_per_sec to stay below it.
+        """
+        tickers = list(tickers)
+        throttle = _Throttle(rate_limit_per_sec) if rate_limit_per_sec else None
+
+        def fetch(ticker):
+            if throttle:
+                time.sleep(throttle.delay())
+            return self.position(ticker)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(tickers, executor.map(fetch, tickers)))
+
     def exchanges(self):
         """Exhange list"""
-        return self._get("equity/metadata/exchanges")
+        return self._get_cached("equity/metadata/exchanges", ttl=METADATA_TTL)
 
     def account_info(self):
         """Account info"""
-        return self._get("equity/account/info")
+        return self._get_cached("equity/account/info", ttl=METADATA_TTL)
 
     def equity_orders(self):
         """All equity orders"""
@@ -136,8 +255,8 @@ class Trading212:
         return self._get(f"equity/orders/{id}")
 
     def equity_order_cancel(self, id: int):
-        """Camcel equity order"""
-        return self._delete_url(f"equity/orders/{id}")
+        """Cancel equity order"""
+        return self._delete_url(f"api/v0/equity/orders/{id}")
 
     def equity_order_place_limit(
         self, ticker: str, quantity: int, limit_price: float, time_validity: str
@@ -0,0 +1,292 @@
+import asyncio
+import logging
+import time
+
+import httpx
+
+from . import METADATA_TTL, Trading212, _loads, _Throttle
+
+
+class AsyncTrading212:
+    """Async Rest API client for Trading212"""
+
+    def __init__(self, api_key: str, demo: bool = True, http2: bool = True):
+        """ """
+        self._api_key = api_key
+        self.host = (
+            "https://demo.trading212.com" if demo else "https://live.trading212.com"
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.host,
+            headers={"Authorization": api_key, "Accept": "application/json"},
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        self._cache = {}
+        self._cache_locks = {}
+
+    async def aclose(self):
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params=None,
+        json=None,
+        headers=None,
+        absolute: bool = False,
+        api_version: str = "v0",
+    ):
+        url = f"/{path.lstrip('/')}" if absolute else f"/api/{api_version}/{path}"
+
+        return await self._client.request(
+            method, url, params=params, json=json, headers=headers
+        )
+
+    async def _request(self, method: str, path: str, **kwargs):
+        return self._process_response(await self._send(method, path, **kwargs))
+
+    async def _get(self, endpoint: str, params=None, api_version: str = "v0"):
+        return await self._request(
+            "GET", endpoint, params=params, api_version=api_version
+        )
+
+    async def _post(self, endpoint: str, data: dict, api_version: str = "v0"):
+        return await self._request("POST", endpoint, json=data, api_version=api_version)
+
+    async def _get_cached(self, endpoint: str, ttl: float, params=None):
+        key = (endpoint, frozenset((params or {}).items()))
+        # The per-key lock is held while fetching, so concurrent identical
+        # calls wait for the first one while other endpoints proceed
+        async with self._cache_locks.setdefault(key, asyncio.Lock()):
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[2]
+            # Expired entries are revalidated, a 304 keeps the cached data
+            headers = {"If-None-Match": entry[1]} if entry and entry[1] else None
+            resp = await self._send("GET", endpoint, params=params, headers=headers)
+            if resp.status_code == 304:
+                etag, data = entry[1], entry[2]
+            else:
+                etag, data = resp.headers.get("ETag"), self._process_response(resp)
+            self._cache[key] = (time.monotonic() + ttl, etag, data)
+            return data
+
+    def clear_cache(self):
+        """Drop cached metadata responses"""
+        self._cache.clear()
+
+    async def _get_url(self, url):
+        return await self._request("GET", url, absolute=True)
+
+    async def _delete_url(self, url):
+        return await self._request("DELETE", url, absolute=True)
+
+    @staticmethod
+    def _process_response(resp):
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as http_err:
+            logging.error(resp.text)
+            raise http_err
+
+        if not resp.content:
+            return None
+
+        return _loads(resp.content)
+
+    async def _iter_items(self, response):
+        for item in response["items"]:
+            yield item
+        while next_page := response.get("nextPagePath"):
+            response = await self._get_url(next_page)
+            for item in response["items"]:
+                yield item
+
+    async def _iter_history(self, endpoint: str, cursor: int, limit: int, ticker=None):
+        params = {"cursor": cursor, "limit": limit}
+        if ticker:
+            params["ticker"] = ticker
+
+        async for item in self._iter_items(await self._get(endpoint, params=params)):
+            yield item
+
+    async def iter_orders(self, cursor: int = 0, ticker: str = None, limit: int = 50):
+        """Historical order data, fetched page by page"""
+        async for item in self._iter_history(
+            "equity/history/orders", cursor, limit, ticker
+        ):
+            yield item
+
+    async def orders(self, cursor: int = 0, ticker: str = None, limit: int = 50):
+        """Historical order data"""
+        return [
+            item
+            async for item in self.iter_orders(
+                cursor=cursor, ticker=ticker, limit=limit
+            )
+        ]
+
+    async def iter_dividends(
+        self, cursor: int = 0, ticker: str = None, limit: int = 50
+    ):
+        """Dividends paid out, fetched page by page"""
+        async for item in self._iter_history(
+            "history/dividends", cursor, limit, ticker
+        ):
+            yield item
+
+    async def dividends(self, cursor: int = 0, ticker: str = None, limit: int = 50):
+        """Dividends paid out"""
+        return [
+            item
+            async for item in self.iter_dividends(
+                cursor=cursor, ticker=ticker, limit=limit
+            )
+        ]
+
+    async def iter_transactions(self, cursor: int = 0, limit: int = 50):
+        """Transactions list, fetched page by page"""
+        async for item in self._iter_history("history/transactions", cursor, limit):
+            yield item
+
+    async def transactions(self, cursor: int = 0, limit: int = 50):
+        """Transactions list"""
+        return [
+            item async for item in self.iter_transactions(cursor=cursor, limit=limit)
+        ]
+
+    async def instruments(self):
+        """Tradeable instruments metadata"""
+        return await self._get_cached("equity/metadata/instruments", ttl=METADATA_TTL)
+
+    async def cash(self):
+        """Account cash"""
+        return await self._get("equity/account/cash")
+
+    async def portfolio(self):
+        """All open positions"""
+        return await self._get("equity/portfolio")
+
+    async def position(self, ticker: str):
+        """Open position by ticker"""
+        return await self._get(f"equity/portfolio/{ticker}")
+
+    async def bulk_positions(
+        self, tickers, max_concurrency: int = 8, rate_limit_per_sec: float = None
+    ):
+        """Open positions for several tickers, fetched concurrently
+
+        Every ticker is a separate API call and counts against the Trading212
+        rate limit, use rate_limit_per_sec to stay below it.
+        """
+        tickers = list(tickers)
+        throttle = _Throttle(rate_limit_per_sec) if rate_limit_per_sec else None
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(ticker):
+            async with semaphore:
+                if throttle:
+                    await asyncio.sleep(throttle.delay())
+                return await self.position(ticker)
+
+        return dict(zip(tickers, await asyncio.gather(*map(fetch, tickers))))
+
+    async def exchanges(self):
+        """Exhange list"""
+        return await self._get_cached("equity/metadata/exchanges", ttl=METADATA_TTL)
+
+    async def account_info(self):
+        """Account info"""
+        return await self._get_cached("equity/account/info", ttl=METADATA_TTL)
+
+    async def equity_orders(self):
+        """All equity orders"""
+        return await self._get("equity/orders")
+
+    async def equity_order(self, id: int):
+        """Equity order by ID"""
+        return await self._get(f"equity/orders/{id}")
+
+    async def equity_order_cancel(self, id: int):
+        """Cancel equity order"""
+        return await self._delete_url(f"api/v0/equity/orders/{id}")
+
+    async def equity_order_place_limit(
+        self, ticker: str, quantity: int, limit_price: float, time_validity: str
+    ):
+        """Place limit order"""
+
+        Trading212._validate_time_validity(time_validity)
+
+        return await self._post(
+            "equity/orders/limit",
+            data={
+                "quantity": quantity,
+                "limitPrice": limit_price,
+                "ticker": ticker,
+                "timeValidity": time_validity,
+            },
+        )
+
+    async def equity_order_place_market(self, ticker: str, quantity: int):
+        """Place market order"""
+
+        return await self._post(
+            "equity/orders/market", data={"quantity": quantity, "ticker": ticker}
+        )
+
+    async def equity_order_place_stop(
+        self, ticker: str, quantity: int, stop_price: float, time_validity: str
+    ):
+        """Place stop order"""
+
+        Trading212._validate_time_validity(time_validity)
+
+        return await self._post(
+            "equity/orders/stop",
+            data={
+                "quantity": quantity,
+                "stopPrice": stop_price,
+                "ticker": ticker,
+                "timeValidity": time_validity,
+            },
+        )
+
+    async def equity_order_place_stop_limit(
+        self,
+        ticker: str,
+        quantity: int,
+        stop_price: float,
+        limit_price: float,
+        time_validity: str,
+    ):
+        """Place stop-limit order"""
+
+        Trading212._validate_time_validity(time_validity)
+
+        return await self._post(
+            "equity/orders/stop_limit",
+            data={
+                "quantity": quantity,
+                "stopPrice": stop_price,
+                "limitPrice": limit_price,
+                "ticker": ticker,
+                "timeValidity": time_validity,
+            },
+        )
+
+    def __repr__(self):
+        return "AsyncTrading212(api_key=****{}, demo={})".format(
+            self._api_key[-4:], self.host == "https://demo.trading212.com"
+        )